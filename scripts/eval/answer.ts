@@ -0,0 +1,78 @@
+import type { Step, TurnResult } from "../../src/index";
+
+// =============================================================================
+// Ask outcome
+// =============================================================================
+
+/** The subset of an ask result the eval consumes — also what the agent cache persists. */
+export interface AskOutcome {
+	response: string;
+	toolCalls: { name: string; arguments: Record<string, unknown> }[];
+	inferenceTimeMs: number;
+	totalLinks: number;
+	invalidLinks: string[];
+	usage: {
+		inputTokens: number;
+		outputTokens: number;
+		totalTokens: number;
+		cacheReadTokens: number;
+		cacheWriteTokens: number;
+	};
+	responseEffort?: string;
+}
+
+/**
+ * Project a finished turn onto the fields the eval records. Throws when the
+ * turn errored without producing any answer text.
+ */
+export function toAskOutcome(result: TurnResult, repository: string, commitId: string): AskOutcome {
+	// The answer is the text after the last tool call; earlier text is narration between tool rounds
+	const lastToolCall = result.steps.findLastIndex((step) => step.type === "tool_call");
+	const response = result.steps
+		.slice(lastToolCall + 1)
+		.filter((step): step is Extract<Step, { type: "text" }> => step.type === "text")
+		.map((step) => step.text)
+		.join("\n\n");
+	if (result.error && !response.trim()) {
+		throw new Error(`${result.error.errorType}: ${result.error.message}`);
+	}
+
+	const toolCalls = result.steps.flatMap((step) =>
+		step.type === "tool_call" ? [{ name: step.name, arguments: step.params }] : [],
+	);
+	const links = checkLinks(response, repository, commitId);
+	return {
+		response,
+		toolCalls,
+		inferenceTimeMs: result.metadata.latencyMs,
+		totalLinks: links.total,
+		invalidLinks: links.invalid,
+		usage: { ...result.usage },
+		responseEffort: result.metadata.thinkingEffort,
+	};
+}
+
+// =============================================================================
+// Link checking
+// =============================================================================
+
+// Markdown link targets: [text](https://...)
+const MARKDOWN_LINK_RE = /\]\((https?:\/\/[^)\s]+)\)/g;
+
+/**
+ * Count the answer's links and collect those that don't point into the pinned
+ * commit's blob/tree permalinks, which is the only form the system prompt allows.
+ * The base is normalized the way `buildDefaultSystemPrompt` builds it (no
+ * trailing slash or `.git`, 12-char SHA), so links to a longer SHA still match.
+ */
+export function checkLinks(
+	response: string,
+	repository: string,
+	commitId: string,
+): { total: number; invalid: string[] } {
+	const base = repository.replace(/\/+$/, "").replace(/\.git$/, "");
+	const shortSha = commitId.slice(0, 12);
+	const prefixes = [`${base}/blob/${shortSha}`, `${base}/tree/${shortSha}`];
+	const links = Array.from(response.matchAll(MARKDOWN_LINK_RE), (m) => m[1] as string);
+	return { total: links.length, invalid: links.filter((url) => !prefixes.some((p) => url.startsWith(p))) };
+}
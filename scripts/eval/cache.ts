@@ -0,0 +1,88 @@
+import { createHash, randomUUID } from "node:crypto";
+import { mkdir, readFile, rename, rm, writeFile } from "node:fs/promises";
+import { dirname, join } from "node:path";
+
+// =============================================================================
+// Keys
+// =============================================================================
+
+/** Canonicalize newlines and trim so formatting-only differences hit the same entry */
+function normalizeKeyPart(part: string): string {
+	return part.replace(/\r\n?/g, "\n").trim();
+}
+
+/**
+ * Build an exact-match cache key: SHA-256 over the normalized parts.
+ * Parts are NUL-separated so ("ab", "c") and ("a", "bc") hash differently.
+ */
+export function cacheKey(...parts: string[]): string {
+	const hash = createHash("sha256");
+	for (const part of parts) {
+		hash.update(normalizeKeyPart(part));
+		hash.update("\0");
+	}
+	return hash.digest("hex");
+}
+
+// =============================================================================
+// Atomic writes
+// =============================================================================
+
+/**
+ * Write a file via a sibling temp file and rename, so readers (and a crash
+ * mid-write) see either the old contents or the new ones, never a truncation.
+ */
+export async function writeFileAtomic(path: string, data: string): Promise<void> {
+	const tmpPath = `${path}.${process.pid}.${randomUUID()}.tmp`;
+	try {
+		await writeFile(tmpPath, data, "utf-8");
+		await rename(tmpPath, path);
+	} catch (error) {
+		await rm(tmpPath, { force: true });
+		throw error;
+	}
+}
+
+// =============================================================================
+// DiskCache
+// =============================================================================
+
+interface CacheEntry<T> {
+	createdAt: string;
+	value: T;
+}
+
+/**
+ * Content-addressed cache persisted as one JSON file per entry.
+ *
+ * Entries are sharded by the first two hex characters of the key so large
+ * caches don't pile thousands of files into a single directory. Entries are
+ * written atomically; a missing or unreadable entry is treated as a miss.
+ */
+export class DiskCache<T> {
+	readonly #dir: string;
+
+	constructor(dir: string) {
+		this.#dir = dir;
+	}
+
+	#pathFor(key: string): string {
+		return join(this.#dir, key.slice(0, 2), `${key}.json`);
+	}
+
+	async get(key: string): Promise<T | undefined> {
+		try {
+			const raw = await readFile(this.#pathFor(key), "utf-8");
+			return (JSON.parse(raw) as CacheEntry<T>).value;
+		} catch {
+			return undefined;
+		}
+	}
+
+	async set(key: string, value: T): Promise<void> {
+		const path = this.#pathFor(key);
+		await mkdir(dirname(path), { recursive: true });
+		const entry: CacheEntry<T> = { createdAt: new Date().toISOString(), value };
+		await writeFileAtomic(path, JSON.stringify(entry));
+	}
+}
@@ -0,0 +1,98 @@
+// =============================================================================
+// Semaphore
+// =============================================================================
+
+/** Counting semaphore bounding how many calls run at once. */
+export class Semaphore {
+	#available: number;
+	readonly #waiters: (() => void)[] = [];
+
+	constructor(permits: number) {
+		this.#available = permits;
+	}
+
+	async run<T>(fn: () => Promise<T>): Promise<T> {
+		if (this.#available > 0) {
+			this.#available--;
+		} else {
+			await new Promise<void>((resolve) => this.#waiters.push(resolve));
+		}
+		try {
+			return await fn();
+		} finally {
+			// Hand the permit straight to the next waiter, or return it to the pool
+			const next = this.#waiters.shift();
+			if (next) next();
+			else this.#available++;
+		}
+	}
+}
+
+// =============================================================================
+// Scheduling
+// =============================================================================
+
+/**
+ * Run `fn` at most once per key for the lifetime of `inflight`; later callers
+ * with the same key get the first caller's promise.
+ */
+export function singleFlight<T>(inflight: Map<string, Promise<T>>, key: string, fn: () => Promise<T>): Promise<T> {
+	const existing = inflight.get(key);
+	if (existing) return existing;
+	const promise = fn();
+	inflight.set(key, promise);
+	return promise;
+}
+
+/**
+ * Map `fn` over `items` with at most `limit` calls in flight, starting items
+ * in `order` (a permutation of indices; defaults to input order).
+ * Results keep the input order regardless of start or completion order.
+ */
+export async function mapWithConcurrency<T, R>(
+	items: T[],
+	limit: number,
+	fn: (item: T, index: number) => Promise<R>,
+	order: number[] = items.map((_, i) => i),
+): Promise<R[]> {
+	const results = new Array<R>(items.length);
+	let next = 0;
+	const worker = async () => {
+		while (next < order.length) {
+			const index = order[next++] as number;
+			results[index] = await fn(items[index] as T, index);
+		}
+	};
+	await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+	return results;
+}
+
+/**
+ * Like `mapWithConcurrency`, but items with the same `groupOf` key run one
+ * after another as a single chain, and `limit` bounds how many chains are in
+ * flight. A chain waiting on its own earlier items never holds a slot another
+ * group could use. Chains start in the order their first item appears in
+ * `order`, and items within a chain follow `order` too. Results keep the input order.
+ */
+export async function mapInSerialGroups<T, R>(
+	items: T[],
+	limit: number,
+	groupOf: (item: T, index: number) => string,
+	fn: (item: T, index: number) => Promise<R>,
+	order: number[] = items.map((_, i) => i),
+): Promise<R[]> {
+	const chains = new Map<string, number[]>();
+	for (const index of order) {
+		const key = groupOf(items[index] as T, index);
+		const chain = chains.get(key);
+		if (chain) chain.push(index);
+		else chains.set(key, [index]);
+	}
+	const results = new Array<R>(items.length);
+	await mapWithConcurrency([...chains.values()], limit, async (chain) => {
+		for (const index of chain) {
+			results[index] = await fn(items[index] as T, index);
+		}
+	});
+	return results;
+}
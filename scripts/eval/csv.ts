@@ -75,9 +75,12 @@ export type ParseResult = { ok: true; rows: EvalRow[] } | { ok: false; error: st
  * - Newlines inside quoted fields
  * - Escaped quotes (doubled "")
  * - Commas inside quoted fields
+ *
+ * When `limit` is given, parsing stops after that many data rows.
  */
-export function parseCsv(content: string): ParseResult {
-	const records = parseCsvRecords(content);
+export function parseCsv(content: string, limit = Number.POSITIVE_INFINITY): ParseResult {
+	// +1 for the header record
+	const records = parseCsvRecords(content, limit + 1);
 	if (records.length === 0) {
 		return { ok: false, error: "CSV file is empty" };
 	}
@@ -107,14 +110,20 @@ export function parseCsv(content: string): ParseResult {
 		return { ok: false, error: "CSV file has a header but no data rows" };
 	}
 
-	const rows: EvalRow[] = [];
+	// Resolve the input column positions once, not per row
+	const idCol = (hasSessionId ? colIndex.session_id : colIndex.id) as number;
+	const repositoryCol = colIndex.repository as number;
+	const commitIdCol = colIndex.commit_id as number;
+	const questionCol = colIndex.question as number;
+
+	const rows: EvalRow[] = new Array(records.length - 1);
 	for (let i = 1; i < records.length; i++) {
 		const fields = records[i] as string[];
-		rows.push({
-			session_id: hasSessionId ? (fields[colIndex.session_id] ?? "") : (fields[colIndex.id] ?? ""),
-			repository: fields[colIndex.repository] ?? "",
-			commit_id: fields[colIndex.commit_id] ?? "",
-			question: fields[colIndex.question] ?? "",
+		rows[i - 1] = {
+			session_id: fields[idCol] ?? "",
+			repository: fields[repositoryCol] ?? "",
+			commit_id: fields[commitIdCol] ?? "",
+			question: fields[questionCol] ?? "",
 			answer: "",
 			is_answer_complete: "",
 			is_evidence_supported: "",
@@ -134,13 +143,17 @@ export function parseCsv(content: string): ParseResult {
 			judge_model: "",
 			ask_system_prompt: "",
 			judge_prompt: "",
-		});
+			reasoning_level: "",
+		};
 	}
 	return { ok: true, rows };
 }
 
-/** Parse full CSV content into an array of records (each record is an array of field strings) */
-function parseCsvRecords(content: string): string[][] {
+/**
+ * Parse CSV content into an array of records (each record is an array of field strings),
+ * stopping early once `maxRecords` records have been read.
+ */
+function parseCsvRecords(content: string, maxRecords = Number.POSITIVE_INFINITY): string[][] {
 	const records: string[][] = [];
 	let current = "";
 	let inQuotes = false;
@@ -175,6 +188,7 @@ function parseCsvRecords(content: string): string[][] {
 				// Only add non-empty records (skip trailing blank lines)
 				if (fields.some((f) => f.length > 0)) {
 					records.push(fields);
+					if (records.length >= maxRecords) return records;
 				}
 				fields = [];
 			} else {
@@ -195,9 +209,13 @@ function parseCsvRecords(content: string): string[][] {
 // Writing
 // =============================================================================
 
+// Single scan for any character that forces quoting, instead of one includes() pass per character
+const NEEDS_QUOTING_RE = /[",\n]/;
+const QUOTE_RE = /"/g;
+
 function escapeCsvField(value: string): string {
-	if (value.includes(",") || value.includes('"') || value.includes("\n")) {
-		return `"${value.replace(/"/g, '""')}"`;
+	if (NEEDS_QUOTING_RE.test(value)) {
+		return `"${value.replace(QUOTE_RE, '""')}"`;
 	}
 	return value;
 }
@@ -206,9 +224,9 @@ function rowToCsv(row: EvalRow): string {
 	return OUTPUT_COLUMNS.map((col) => escapeCsvField(row[col])).join(",");
 }
 
-export async function loadRowsFromCsv(path: string): Promise<EvalRow[]> {
+export async function loadRowsFromCsv(path: string, limit?: number): Promise<EvalRow[]> {
 	const csvContent = await readFile(path, "utf-8");
-	const parsed = parseCsv(csvContent);
+	const parsed = parseCsv(csvContent, limit);
 	if (!parsed.ok) {
 		throw new Error(parsed.error);
 	}
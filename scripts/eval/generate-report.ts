@@ -5,6 +5,9 @@
 
 import { readFile } from "node:fs/promises";
 
+// Matches every {{TOKEN}} placeholder in the template
+const PLACEHOLDER_RE = /\{\{([A-Z_]+)\}\}/g;
+
 interface ReportStats {
 	total: number;
 	complete: number;
@@ -29,7 +32,7 @@ export async function generateReport(
 	systemPrompt: string,
 ): Promise<string> {
 	const templatePath = new URL("report-template.html", import.meta.url).pathname;
-	let html = await readFile(templatePath, "utf-8");
+	const template = await readFile(templatePath, "utf-8");
 
 	const pct = (n: number, d: number) => (d > 0 ? ((n / d) * 100).toFixed(1) : "0.0");
 
@@ -40,24 +43,24 @@ export async function generateReport(
 	const systemPromptJson = escapeScript(systemPrompt);
 
 	const replacements: Record<string, string> = {
-		"{{TIMESTAMP}}": timestamp,
-		"{{TOTAL}}": String(stats.total),
-		"{{COMPLETE_PCT}}": pct(stats.complete, stats.total),
-		"{{COMPLETE_COUNT}}": String(stats.complete),
-		"{{EVIDENCED_PCT}}": pct(stats.evidenced, stats.total),
-		"{{EVIDENCED_COUNT}}": String(stats.evidenced),
-		"{{LINKED_PCT}}": pct(stats.linked, stats.total),
-		"{{LINKED_COUNT}}": String(stats.linked),
-		"{{SOUND_PCT}}": pct(stats.soundReasoning, stats.total),
-		"{{SOUND_COUNT}}": String(stats.soundReasoning),
-		"{{BROKEN_LINK_RATIO}}": stats.brokenLinkRatio,
-		"{{CSV_JSON}}": csvJson,
-		"{{SYSTEM_PROMPT_JSON}}": systemPromptJson,
+		TIMESTAMP: timestamp,
+		TOTAL: String(stats.total),
+		COMPLETE_PCT: pct(stats.complete, stats.total),
+		COMPLETE_COUNT: String(stats.complete),
+		EVIDENCED_PCT: pct(stats.evidenced, stats.total),
+		EVIDENCED_COUNT: String(stats.evidenced),
+		LINKED_PCT: pct(stats.linked, stats.total),
+		LINKED_COUNT: String(stats.linked),
+		SOUND_PCT: pct(stats.soundReasoning, stats.total),
+		SOUND_COUNT: String(stats.soundReasoning),
+		BROKEN_LINK_RATIO: stats.brokenLinkRatio,
+		CSV_JSON: csvJson,
+		SYSTEM_PROMPT_JSON: systemPromptJson,
 	};
 
-	for (const [token, value] of Object.entries(replacements)) {
-		html = html.replaceAll(token, value);
-	}
-
-	return html;
+	// One pass over the template with a replacer function. Sequential replaceAll
+	// calls re-scanned the whole (CSV-sized) document once per token, could
+	// substitute placeholders that appear inside the injected data, and
+	// interpreted `$&`-style patterns in replacement strings.
+	return template.replace(PLACEHOLDER_RE, (match, token: string) => replacements[token] ?? match);
 }
@@ -14,13 +14,18 @@ const provider = new NodeTracerProvider({
 });
 provider.register();
 
-import { mkdir, writeFile } from "node:fs/promises";
+import { type FileHandle, mkdir, open, rm } from "node:fs/promises";
 import { parseArgs } from "node:util";
 import { completeSimple, getModel, type ThinkingLevel } from "@mariozechner/pi-ai";
-import { MAX_TOOL_ITERATIONS, MODEL_NAME, MODEL_PROVIDER, type ThinkingConfig } from "../../src/config";
-import { buildDefaultSystemPrompt, Client, nullLogger } from "../../src/index";
+import type { ThinkingConfig } from "../../src/config";
+import { buildDefaultSystemPrompt, Client, type ModelConfig, nullLogger } from "../../src/index";
 import { JUDGE_SYSTEM_PROMPT } from "../../src/prompt";
+import { tools } from "../../src/tools";
+import { type AskOutcome, toAskOutcome } from "./answer";
+import { cacheKey, DiskCache, writeFileAtomic } from "./cache";
+import { mapInSerialGroups, Semaphore, singleFlight } from "./concurrency";
 import { type EvalRow, loadRowsFromCsv, writeCsvString } from "./csv";
+import { checkoutKeys, longestFirstOrder } from "./schedule";
 
 // =============================================================================
 // LLM Judge (commented out — currently using link validation instead)
@@ -29,6 +34,10 @@ import { type EvalRow, loadRowsFromCsv, writeCsvString } from "./csv";
 const JUDGE_MODEL_PROVIDER = "openrouter";
 const JUDGE_MODEL_NAME = "anthropic/claude-sonnet-4.6";
 
+// Resolved once at module load rather than on every judge call
+// biome-ignore lint/suspicious/noExplicitAny: model ID not yet in SDK types
+const JUDGE_MODEL = getModel(JUDGE_MODEL_PROVIDER, JUDGE_MODEL_NAME as any);
+
 type JudgeVerdict = "yes" | "no" | "error";
 
 interface JudgeResult {
@@ -39,154 +48,333 @@ interface JudgeResult {
 	misc_feedback: string;
 }
 
-async function judge(question: string, answer: string): Promise<JudgeResult> {
-	// biome-ignore lint/suspicious/noExplicitAny: model ID not yet in SDK types
-	const model = getModel(JUDGE_MODEL_PROVIDER, JUDGE_MODEL_NAME as any);
+// Markdown code fences the judge sometimes wraps its JSON in
+const LEADING_FENCE_RE = /^```(?:json)?\s*\n?/m;
+const TRAILING_FENCE_RE = /\n?```\s*$/m;
+
+/** Normalize a judge yes/no value, logging anything we can't interpret. */
+function normalizeVerdict(field: string, v: string | undefined): JudgeVerdict {
+	if (v == null) {
+		console.error(`Judge error: field "${field}" is missing from response`);
+		return "error";
+	}
+	const lower = v.toLowerCase();
+	if (lower.startsWith("yes")) return "yes";
+	if (lower.startsWith("no")) return "no";
+	console.error(`Judge error: field "${field}" has unrecognized value: "${v}"`);
+	return "error";
+}
 
+async function judge(question: string, answer: string): Promise<JudgeResult> {
 	const userMessage = `## Question
 ${question}
 
 ## Answer
 ${answer}`;
 
-	const response = await completeSimple(model, {
+	const response = await completeSimple(JUDGE_MODEL, {
 		systemPrompt: JUDGE_SYSTEM_PROMPT,
 		messages: [{ role: "user", content: userMessage, timestamp: Date.now() }],
 	});
 
+	if (response.stopReason === "error") {
+		throw new Error(`Judge API error: ${response.errorMessage ?? "unknown error"}`);
+	}
+
 	const text = response.content
 		.filter((b) => b.type === "text")
 		.map((b) => (b as { type: "text"; text: string }).text)
 		.join("");
 
 	// Strip markdown code fences if present
-	const cleaned = text
-		.replace(/^```(?:json)?\s*\n?/m, "")
-		.replace(/\n?```\s*$/m, "")
-		.trim();
+	const cleaned = text.replace(LEADING_FENCE_RE, "").replace(TRAILING_FENCE_RE, "").trim();
 
 	const parsed = JSON.parse(cleaned) as JudgeResult;
 
-	// Normalize yes/no values
-	const normalize = (field: string, v: string | undefined): JudgeVerdict => {
-		if (v == null) {
-			console.error(`Judge error: field "${field}" is missing from response`);
-			return "error";
-		}
-		const lower = v.toLowerCase();
-		if (lower.startsWith("yes")) return "yes";
-		if (lower.startsWith("no")) return "no";
-		console.error(`Judge error: field "${field}" has unrecognized value: "${v}"`);
-		return "error";
-	};
-
 	return {
-		is_answer_complete: normalize("is_answer_complete", parsed.is_answer_complete),
-		is_evidence_supported: normalize("is_evidence_supported", parsed.is_evidence_supported),
-		is_evidence_linked: normalize("is_evidence_linked", parsed.is_evidence_linked),
-		is_reasoning_sound: normalize("is_reasoning_sound", parsed.is_reasoning_sound),
+		is_answer_complete: normalizeVerdict("is_answer_complete", parsed.is_answer_complete),
+		is_evidence_supported: normalizeVerdict("is_evidence_supported", parsed.is_evidence_supported),
+		is_evidence_linked: normalizeVerdict("is_evidence_linked", parsed.is_evidence_linked),
+		is_reasoning_sound: normalizeVerdict("is_reasoning_sound", parsed.is_reasoning_sound),
 		misc_feedback: typeof parsed.misc_feedback === "string" ? parsed.misc_feedback : "",
 	};
 }
 
+const JUDGE_MAX_ATTEMPTS = 4;
+const JUDGE_MAX_BACKOFF_MS = 8000;
+
+/**
+ * Judge with bounded retries and jittered exponential backoff (0.5s, 1s, 2s, … capped at 8s).
+ * Covers transient provider failures (429/5xx surface as error responses) and
+ * the occasional malformed JSON verdict, both of which previously cost the row its verdicts.
+ */
+async function judgeWithRetry(question: string, answer: string): Promise<JudgeResult> {
+	for (let attempt = 1; ; attempt++) {
+		try {
+			return await judge(question, answer);
+		} catch (error) {
+			if (attempt >= JUDGE_MAX_ATTEMPTS) throw error;
+			const delay = Math.min(500 * 2 ** (attempt - 1), JUDGE_MAX_BACKOFF_MS) + Math.random() * 250;
+			console.error(
+				`Judge attempt ${attempt}/${JUDGE_MAX_ATTEMPTS} failed (${error instanceof Error ? error.message : String(error)}), retrying in ${Math.round(delay)}ms`,
+			);
+			await Bun.sleep(delay);
+		}
+	}
+}
+
+/**
+ * Judge an answer, reusing a cached verdict for an identical (model, prompt,
+ * question, answer) tuple. The model and prompt are part of the key, so
+ * changing either invalidates old entries. Verdicts containing an error are
+ * not cached so they get retried on the next run.
+ */
+async function cachedJudge(ctx: EvalContext, question: string, answer: string): Promise<JudgeResult> {
+	const key = cacheKey(`${JUDGE_MODEL_PROVIDER}/${JUDGE_MODEL_NAME}`, JUDGE_SYSTEM_PROMPT, question, answer);
+	return singleFlight(ctx.judgeInflight, key, async () => {
+		const cached = await ctx.judgeCache.get(key);
+		if (cached) return cached;
+
+		const result = await ctx.judgeLimiter.run(() => judgeWithRetry(question, answer));
+		const hasError = [
+			result.is_answer_complete,
+			result.is_evidence_supported,
+			result.is_evidence_linked,
+			result.is_reasoning_sound,
+		].includes("error");
+		if (!hasError) {
+			await ctx.judgeCache.set(key, result);
+		}
+		return result;
+	});
+}
+
+/** Verdict for an empty answer: it fails every criterion, so the judge isn't consulted. */
+const EMPTY_ANSWER_VERDICT: JudgeResult = {
+	is_answer_complete: "no",
+	is_evidence_supported: "no",
+	is_evidence_linked: "no",
+	is_reasoning_sound: "no",
+	misc_feedback: "- Empty answer; judge skipped",
+};
+
 // =============================================================================
 // Main
 // =============================================================================
 
-async function runEval(inputPath: string, thinking: ThinkingConfig | undefined): Promise<void> {
-	const timestamp = new Date().toISOString().replace(/[:.]/g, "-").replace("T", "_").replace("Z", "");
-	const reportsDir = new URL("reports/", import.meta.url).pathname;
-	await mkdir(reportsDir, { recursive: true });
-	const outputPath = `${reportsDir}eval_${timestamp}.csv`;
+/** Agent under evaluation */
+const ASK_MODEL: ModelConfig = { provider: "openrouter", id: "anthropic/claude-sonnet-4.6" };
+const ASK_MAX_ITERATIONS = 20;
+/**
+ * Part of every agent-cache key. Tool definitions and the iteration budget are
+ * keyed automatically; bump this when agent behavior changes in a way they
+ * don't capture (tool implementations, stream handling, compaction).
+ */
+const AGENT_CACHE_VERSION = 1;
+
+const DEFAULT_CONCURRENCY = 4;
+/** Cap on concurrent judge calls, independent of row concurrency (override with EVAL_JUDGE_CONCURRENCY). */
+const DEFAULT_JUDGE_CONCURRENCY = 8;
+
+/** CLI-level settings for a single eval run. */
+interface RunOptions {
+	thinking: ThinkingConfig | undefined;
+	concurrency: number;
+	/** Cap on concurrent judge calls across all rows. */
+	judgeConcurrency: number;
+	/** Serve previously cached agent answers instead of re-asking. */
+	useAgentCache: boolean;
+	/** Evaluate only the first N dataset rows. */
+	limit: number | undefined;
+}
 
-	let rows: EvalRow[];
-	try {
-		rows = await loadRowsFromCsv(inputPath);
-	} catch (error) {
-		console.error(`Error loading dataset: ${error instanceof Error ? error.message : String(error)}`);
-		process.exit(1);
+/** Shared, per-run state needed to evaluate a single row. */
+interface EvalContext {
+	client: Client;
+	options: RunOptions;
+	askModelLabel: string;
+	judgeModelLabel: string;
+	judgePromptText: string;
+	judgeCache: DiskCache<JudgeResult>;
+	agentCache: DiskCache<AskOutcome>;
+	/** In-flight work by cache key, so duplicate rows within a run share one ask/judge call. */
+	askInflight: Map<string, Promise<{ result: AskOutcome; cached: boolean }>>;
+	judgeInflight: Map<string, Promise<JudgeResult>>;
+	judgeLimiter: Semaphore;
+	total: number;
+}
+
+interface RowOutcome {
+	row: EvalRow;
+	totalLinks: number;
+	brokenLinks: number;
+}
+
+/**
+ * Append-only JSONL log of finished rows, so a run that dies midway keeps its
+ * completed work. Each append costs O(1) regardless of how many rows are
+ * already done; the full CSV is only materialized once, at the end.
+ */
+class Checkpoint {
+	readonly path: string;
+	readonly #handle: FileHandle;
+	// Appends are chained so concurrent rows never interleave partial lines
+	#tail: Promise<void> = Promise.resolve();
+
+	private constructor(path: string, handle: FileHandle) {
+		this.path = path;
+		this.#handle = handle;
 	}
 
-	console.log(`Reading dataset from: ${inputPath}`);
-	console.log(`Found ${rows.length} rows to evaluate`);
-	if (thinking) {
-		console.log(`Thinking: ${thinking.type === "adaptive" ? "adaptive" : `effort=${thinking.effort}`}`);
+	static async open(path: string): Promise<Checkpoint> {
+		return new Checkpoint(path, await open(path, "a"));
 	}
-	console.log();
 
-	const client = new Client(
-		{
-			provider: MODEL_PROVIDER,
-			model: MODEL_NAME,
-			maxIterations: MAX_TOOL_ITERATIONS,
-			thinking,
-		},
-		nullLogger,
-	);
+	append(index: number, row: EvalRow): Promise<void> {
+		const line = `${JSON.stringify({ index, row })}\n`;
+		// A failed append is logged, not propagated: a rejected tail would fail every
+		// later append and abort the run the checkpoint exists to protect
+		this.#tail = this.#tail
+			.then(() => this.#handle.appendFile(line, "utf-8"))
+			.catch((error) => {
+				console.error(
+					`Checkpoint write failed for row ${index + 1} (${this.path}): ${error instanceof Error ? error.message : String(error)}`,
+				);
+			});
+		return this.#tail;
+	}
 
-	const askModelLabel = `${MODEL_PROVIDER}/${MODEL_NAME}`;
-	const judgeModelLabel = `${JUDGE_MODEL_PROVIDER}/${JUDGE_MODEL_NAME}`;
-	const judgePromptText = JUDGE_SYSTEM_PROMPT;
+	/** Flush pending appends and delete the log once the final report is safely written. */
+	async discard(): Promise<void> {
+		await this.#tail;
+		await this.#handle.close();
+		await rm(this.path, { force: true });
+	}
+}
 
-	const resultRows: EvalRow[] = [];
-	let sumTotalLinks = 0;
-	let sumBrokenLinks = 0;
+async function ask(ctx: EvalContext, row: EvalRow, systemPrompt: string): Promise<AskOutcome> {
+	const { repository, commit_id, question } = row;
+	const session = await ctx.client.connect({
+		repo: { url: repository, commitish: commit_id },
+		model: ASK_MODEL,
+		systemPrompt,
+		maxIterations: ASK_MAX_ITERATIONS,
+		thinking: ctx.options.thinking,
+	});
+	try {
+		const result = await session.ask(question).result();
+		return toAskOutcome(result, repository, commit_id);
+	} finally {
+		await session.close();
+	}
+}
 
-	for (let i = 0; i < rows.length; i++) {
-		const row = rows[i];
-		if (!row) continue;
-		const { repository, commit_id, question } = row;
-		console.log(`\n[${i + 1}/${rows.length}] Asking: "${question.slice(0, 80)}${question.length > 80 ? "..." : ""}"`);
-		console.log(`  Repo: ${repository} @ ${commit_id.slice(0, 12)}`);
+/**
+ * Ask a question, reusing a cached answer for the same repository, commit,
+ * question, ask model, thinking config, system prompt, iteration budget and
+ * tool definitions. Fresh answers are always written back, so
+ * `--no-agent-cache` refreshes stale entries. Duplicate rows in the same run
+ * are asked only once; every row after the first is marked `shared`.
+ */
+async function cachedAsk(
+	ctx: EvalContext,
+	row: EvalRow,
+	systemPrompt: string,
+): Promise<{ result: AskOutcome; cached: boolean; shared: boolean }> {
+	const { repository, commit_id, question } = row;
+	const key = cacheKey(
+		String(AGENT_CACHE_VERSION),
+		ctx.askModelLabel,
+		JSON.stringify(ctx.options.thinking ?? null),
+		String(ASK_MAX_ITERATIONS),
+		JSON.stringify(tools),
+		systemPrompt,
+		repository,
+		commit_id,
+		question,
+	);
+	let first = false;
+	const answer = await singleFlight(ctx.askInflight, key, async () => {
+		first = true;
+		if (ctx.options.useAgentCache) {
+			const cached = await ctx.agentCache.get(key);
+			if (cached) return { result: cached, cached: true };
+		}
 
-		const askSystemPrompt = buildDefaultSystemPrompt(repository, commit_id);
+		const result = await ask(ctx, row, systemPrompt);
+		// Empty answers are almost always failed runs — don't pin them in the cache
+		if (result.response.trim()) {
+			await ctx.agentCache.set(key, result);
+		}
+		return { result, cached: false };
+	});
+	return { ...answer, shared: !first };
+}
 
-		let session: Awaited<ReturnType<typeof client.connect>> | null = null;
-		try {
-			session = await client.connect(repository, { commitish: commit_id });
-			const askResult = await session.ask(question);
-			const secs = (askResult.inferenceTimeMs / 1000).toFixed(1);
-			console.log(
-				`  ✓ Got response (${askResult.response.length} chars, ${askResult.toolCalls.length} tool calls, ${secs}s, ${askResult.totalLinks} links, ${askResult.invalidLinks.length} broken)`,
-			);
+async function evaluateRow(ctx: EvalContext, row: EvalRow, index: number): Promise<RowOutcome> {
+	const { askModelLabel, judgeModelLabel, judgePromptText } = ctx;
+	const { repository, commit_id, question } = row;
+	// Rows run concurrently, so every line is tagged with its position to keep interleaved output readable
+	const tag = `[${index + 1}/${ctx.total}]`;
+	console.log(`\n${tag} Asking: "${question.slice(0, 80)}${question.length > 80 ? "..." : ""}"`);
+	console.log(`${tag}   Repo: ${repository} @ ${commit_id.slice(0, 12)}`);
 
-			// Format tool calls as a bulleted plain-text list
-			const toolCallsStr = askResult.toolCalls.map((tc) => `- ${tc.name}: ${JSON.stringify(tc.arguments)}`).join("\n");
-
-			// Extract file names from read tool calls
-			const filesReadStr = askResult.toolCalls
-				.filter((tc) => tc.name === "read")
-				.map((tc) => {
-					const filePath = String(tc.arguments.path ?? tc.arguments.file ?? "");
-					const fileName = filePath.split("/").pop() || filePath;
-					return `- ${fileName}`;
-				})
-				.join("\n");
-
-			// Broken links as ratio string
-			const totalLinks = askResult.totalLinks;
-			const brokenCount = askResult.invalidLinks.length;
-			sumTotalLinks += totalLinks;
-			sumBrokenLinks += brokenCount;
-
-			// Run LLM judge
-			let judgeResult: JudgeResult = {
-				is_answer_complete: "error",
-				is_evidence_supported: "error",
-				is_evidence_linked: "error",
-				is_reasoning_sound: "error",
-				misc_feedback: "",
-			};
+	const askSystemPrompt = buildDefaultSystemPrompt(repository, commit_id);
+
+	try {
+		const { result: askResult, cached, shared } = await cachedAsk(ctx, row, askSystemPrompt);
+		const secs = (askResult.inferenceTimeMs / 1000).toFixed(1);
+		console.log(
+			`${tag}   ✓ Got response${cached ? " (cached)" : shared ? " (duplicate)" : ""} (${askResult.response.length} chars, ${askResult.toolCalls.length} tool calls, ${secs}s, ${askResult.totalLinks} links, ${askResult.invalidLinks.length} broken)`,
+		);
+
+		// Format tool calls as a bulleted plain-text list
+		const toolCallsStr = askResult.toolCalls.map((tc) => `- ${tc.name}: ${JSON.stringify(tc.arguments)}`).join("\n");
+
+		// Extract file names from read tool calls
+		const filesReadStr = askResult.toolCalls
+			.filter((tc) => tc.name === "read")
+			.map((tc) => {
+				const filePath = String(tc.arguments.path ?? tc.arguments.file ?? "");
+				const fileName = filePath.split("/").pop() || filePath;
+				return `- ${fileName}`;
+			})
+			.join("\n");
+
+		// Broken links as ratio string
+		const totalLinks = askResult.totalLinks;
+		const brokenCount = askResult.invalidLinks.length;
+
+		// Run LLM judge
+		let judgeResult: JudgeResult = {
+			is_answer_complete: "error",
+			is_evidence_supported: "error",
+			is_evidence_linked: "error",
+			is_reasoning_sound: "error",
+			misc_feedback: "",
+		};
+		if (!askResult.response.trim()) {
+			judgeResult = EMPTY_ANSWER_VERDICT;
+			console.log(`${tag}   ⚖ Judge: skipped (empty answer)`);
+		} else {
 			try {
-				judgeResult = await judge(question, askResult.response);
+				judgeResult = await cachedJudge(ctx, question, askResult.response);
 				console.log(
-					`  ⚖ Judge: complete=${judgeResult.is_answer_complete}, supported=${judgeResult.is_evidence_supported}, linked=${judgeResult.is_evidence_linked}, sound=${judgeResult.is_reasoning_sound}`,
+					`${tag}   ⚖ Judge: complete=${judgeResult.is_answer_complete}, supported=${judgeResult.is_evidence_supported}, linked=${judgeResult.is_evidence_linked}, sound=${judgeResult.is_reasoning_sound}`,
 				);
 			} catch (err) {
-				console.error(`  ⚖ Judge error: ${err instanceof Error ? err.message : String(err)}`);
+				console.error(`${tag}   ⚖ Judge error: ${err instanceof Error ? err.message : String(err)}`);
 			}
+		}
+
+		// A cached answer's timing and token usage belong to the run that produced it, and a
+		// duplicate's to the row that asked; leave those columns blank so each ask is counted once
+		const measured = (n: number) => (cached || shared ? "" : String(n));
 
-			resultRows.push({
+		return {
+			totalLinks,
+			brokenLinks: brokenCount,
+			row: {
 				...row,
 				answer: askResult.response,
 				is_answer_complete: judgeResult.is_answer_complete,
@@ -197,21 +385,25 @@ async function runEval(inputPath: string, thinking: ThinkingConfig | undefined):
 				broken_link_ratio: `${brokenCount}/${totalLinks}`,
 				tool_calls: toolCallsStr,
 				files_read: filesReadStr,
-				inference_time_ms: String(askResult.inferenceTimeMs),
-				input_tokens: String(askResult.usage.inputTokens),
-				output_tokens: String(askResult.usage.outputTokens),
-				total_tokens: String(askResult.usage.totalTokens),
-				cache_read_tokens: String(askResult.usage.cacheReadTokens),
-				cache_write_tokens: String(askResult.usage.cacheWriteTokens),
+				inference_time_ms: measured(askResult.inferenceTimeMs),
+				input_tokens: measured(askResult.usage.inputTokens),
+				output_tokens: measured(askResult.usage.outputTokens),
+				total_tokens: measured(askResult.usage.totalTokens),
+				cache_read_tokens: measured(askResult.usage.cacheReadTokens),
+				cache_write_tokens: measured(askResult.usage.cacheWriteTokens),
 				ask_model: askModelLabel,
 				judge_model: judgeModelLabel,
 				ask_system_prompt: askSystemPrompt,
 				judge_prompt: judgePromptText,
 				reasoning_level: askResult.responseEffort ?? "",
-			});
-		} catch (error) {
-			console.error(`  ✗ Error: ${error instanceof Error ? error.message : String(error)}`);
-			resultRows.push({
+			},
+		};
+	} catch (error) {
+		console.error(`${tag}   ✗ Error: ${error instanceof Error ? error.message : String(error)}`);
+		return {
+			totalLinks: 0,
+			brokenLinks: 0,
+			row: {
 				...row,
 				answer: "",
 				is_answer_complete: "",
@@ -233,25 +425,82 @@ async function runEval(inputPath: string, thinking: ThinkingConfig | undefined):
 				ask_system_prompt: askSystemPrompt,
 				judge_prompt: judgePromptText,
 				reasoning_level: "",
-			});
-		} finally {
-			await session?.close();
-		}
+			},
+		};
+	}
+}
+
+async function runEval(inputPath: string, options: RunOptions): Promise<void> {
+	const { thinking, concurrency } = options;
+	const timestamp = new Date().toISOString().replace(/[:.]/g, "-").replace("T", "_").replace("Z", "");
+	const reportsDir = new URL("reports/", import.meta.url).pathname;
+	await mkdir(reportsDir, { recursive: true });
+	const outputPath = `${reportsDir}eval_${timestamp}.csv`;
+	const checkpointPath = `${reportsDir}eval_${timestamp}.partial.jsonl`;
+
+	if (options.limit !== undefined) {
+		console.log(`Limit: first ${options.limit} rows`);
+	}
+
+	let rows: EvalRow[];
+	try {
+		rows = await loadRowsFromCsv(inputPath, options.limit);
+	} catch (error) {
+		console.error(`Error loading dataset: ${error instanceof Error ? error.message : String(error)}`);
+		process.exit(1);
+	}
+
+	console.log(`Reading dataset from: ${inputPath}`);
+	console.log(`Found ${rows.length} rows to evaluate`);
+	console.log(`Concurrency: ${concurrency} (judge: ${options.judgeConcurrency})`);
+	if (!options.useAgentCache) {
+		console.log("Agent cache: disabled (re-asking every question)");
 	}
+	if (thinking) {
+		console.log(`Thinking: ${thinking.type === "adaptive" ? "adaptive" : `effort=${thinking.effort}`}`);
+	}
+	console.log();
+
+	const ctx: EvalContext = {
+		client: new Client({ logger: nullLogger }),
+		options,
+		askModelLabel: `${ASK_MODEL.provider}/${ASK_MODEL.id}`,
+		judgeModelLabel: `${JUDGE_MODEL_PROVIDER}/${JUDGE_MODEL_NAME}`,
+		judgePromptText: JUDGE_SYSTEM_PROMPT,
+		judgeCache: new DiskCache<JudgeResult>(`${reportsDir}judge-cache/`),
+		agentCache: new DiskCache<AskOutcome>(`${reportsDir}response-cache/`),
+		askInflight: new Map(),
+		judgeInflight: new Map(),
+		judgeLimiter: new Semaphore(options.judgeConcurrency),
+		total: rows.length,
+	};
+
+	const checkpoint = await Checkpoint.open(checkpointPath);
+	// Rows sharing a checkout run as one serial chain (see checkoutKeys); the pool bounds active chains
+	const checkouts = checkoutKeys(rows);
+	const outcomes = await mapInSerialGroups(
+		rows,
+		concurrency,
+		(_, index) => checkouts[index] as string,
+		async (row, index) => {
+			const outcome = await evaluateRow(ctx, row, index);
+			await checkpoint.append(index, outcome.row);
+			return outcome;
+		},
+		longestFirstOrder(rows, checkouts),
+	);
+	const resultRows = outcomes.map((o) => o.row);
+	const sumTotalLinks = outcomes.reduce((sum, o) => sum + o.totalLinks, 0);
+	const sumBrokenLinks = outcomes.reduce((sum, o) => sum + o.brokenLinks, 0);
 
 	const output = writeCsvString(resultRows);
-	await writeFile(outputPath, output, "utf-8");
+	await writeFileAtomic(outputPath, output);
+	await checkpoint.discard();
 	console.log(`\n✓ Results written to: ${outputPath}`);
 
 	// Print summary
-	const total = resultRows.length;
-	const _complete = resultRows.filter((r) => r.is_answer_complete === "yes").length;
-	const _evidenced = resultRows.filter((r) => r.is_evidence_supported === "yes").length;
-	const _linked = resultRows.filter((r) => r.is_evidence_linked === "yes").length;
-	const _soundReasoning = resultRows.filter((r) => r.is_reasoning_sound === "yes").length;
-
 	console.log("\n--- Summary ---");
-	console.log(`Total rows:          ${total}`);
+	console.log(`Total rows:          ${resultRows.length}`);
 	console.log(`Broken links:        ${sumBrokenLinks}/${sumTotalLinks}`);
 }
 
@@ -263,6 +512,9 @@ const { values, positionals } = parseArgs({
 	options: {
 		thinking: { type: "string", default: "" },
 		effort: { type: "string", default: "" },
+		concurrency: { type: "string", default: String(DEFAULT_CONCURRENCY) },
+		"no-agent-cache": { type: "boolean", default: false },
+		limit: { type: "string", default: "" },
 	},
 	strict: true,
 	allowPositionals: true,
@@ -271,9 +523,14 @@ const { values, positionals } = parseArgs({
 const inputPath = positionals[2]; // skip bun executable and script path
 
 if (!inputPath) {
-	console.error("Usage: bun run eval/run-eval.ts <path-to-dataset.csv> [--thinking adaptive] [--effort <level>]");
+	console.error(
+		"Usage: bun run eval/run-eval.ts <path-to-dataset.csv> [--thinking adaptive] [--effort <level>] [--concurrency <n>] [--limit <n>] [--no-agent-cache]",
+	);
 	console.error("  --thinking adaptive   model decides when/how much to think (Anthropic 4.6 only)");
 	console.error("  --effort <level>      minimal, low, medium, high, xhigh (all providers)");
+	console.error(`  --concurrency <n>     rows evaluated in parallel (default: ${DEFAULT_CONCURRENCY})`);
+	console.error("  --limit <n>           only evaluate the first n rows of the dataset");
+	console.error("  --no-agent-cache      re-ask every question instead of reusing cached answers");
 	process.exit(1);
 }
 
@@ -293,5 +550,27 @@ if (values.thinking === "adaptive") {
 	thinking = { effort: effort as ThinkingLevel };
 }
 
-await runEval(inputPath, thinking);
+const concurrency = Number(values.concurrency);
+if (!Number.isInteger(concurrency) || concurrency < 1) {
+	console.error(`Invalid --concurrency value: "${values.concurrency}". Must be a positive integer.`);
+	process.exit(1);
+}
+
+const rawJudgeConcurrency = process.env.EVAL_JUDGE_CONCURRENCY || String(DEFAULT_JUDGE_CONCURRENCY);
+const judgeConcurrency = Number(rawJudgeConcurrency);
+if (!Number.isInteger(judgeConcurrency) || judgeConcurrency < 1) {
+	console.error(`Invalid EVAL_JUDGE_CONCURRENCY value: "${rawJudgeConcurrency}". Must be a positive integer.`);
+	process.exit(1);
+}
+
+let limit: number | undefined;
+if (values.limit) {
+	limit = Number(values.limit);
+	if (!Number.isInteger(limit) || limit < 1) {
+		console.error(`Invalid --limit value: "${values.limit}". Must be a positive integer.`);
+		process.exit(1);
+	}
+}
+
+await runEval(inputPath, { thinking, concurrency, judgeConcurrency, useAgentCache: !values["no-agent-cache"], limit });
 await provider.shutdown();
@@ -0,0 +1,76 @@
+import { parseRepoPath } from "../../src/forge/providers";
+import type { EvalRow } from "./csv";
+
+// =============================================================================
+// Checkouts
+// =============================================================================
+
+// Commit ids that can be abbreviations of one another; anything else is a branch or tag name
+const SHA_RE = /^[0-9a-f]{4,40}$/;
+
+/** `<user>/<repo>`, the part of the URL `connectRepo` keys its clone and worktrees on. */
+function repoPath(repository: string): string {
+	try {
+		const { username, reponame } = parseRepoPath(repository);
+		return `${username}/${reponame}`;
+	} catch {
+		// Unparseable URLs fail in connect anyway; keying them as written is enough
+		return repository;
+	}
+}
+
+/**
+ * Key each row by the worktree its session will check out. `connectRepo` keeps
+ * one worktree per `<user>/<repo>` and 12-char SHA, whatever the host or a
+ * `.git` suffix, and `session.close()` removes it, so rows with equal keys must
+ * not overlap. An abbreviated SHA shares the key of a longer SHA in the dataset
+ * that it prefixes; branch and tag names can't be resolved here and are keyed
+ * as written.
+ */
+export function checkoutKeys(rows: EvalRow[]): string[] {
+	const refs = rows.map((row) => {
+		const commit = row.commit_id.trim();
+		const sha = commit.toLowerCase();
+		return { repo: repoPath(row.repository), commit: SHA_RE.test(sha) ? sha : commit };
+	});
+	return refs.map(({ repo, commit }) => {
+		if (!SHA_RE.test(commit)) return `${repo}@${commit}`;
+		const longest = refs.reduce(
+			(best, other) =>
+				other.repo === repo && other.commit.length > best.length && other.commit.startsWith(best) ? other.commit : best,
+			commit,
+		);
+		return `${repo}@${longest.slice(0, 12)}`;
+	});
+}
+
+// =============================================================================
+// Dispatch order
+// =============================================================================
+
+/**
+ * Rough relative cost of evaluating a row. Longer questions tend to be
+ * multi-part and drive more tool calls, so question length is the best proxy
+ * available before the row has run.
+ */
+function estimateRowCost(row: EvalRow): number {
+	return row.question.length;
+}
+
+/**
+ * Longest-expected-first dispatch order. Rows sharing a checkout key run as one
+ * serial chain, so wall time is bounded by the costliest chain: chains are
+ * ordered by their total expected cost and rows within a chain longest-first,
+ * letting the likely-slow work start early and quick rows fill in the tail.
+ */
+export function longestFirstOrder(rows: EvalRow[], checkouts: string[]): number[] {
+	const costs = rows.map(estimateRowCost);
+	const chainCosts = new Map<string, number>();
+	for (const [i, key] of checkouts.entries()) {
+		chainCosts.set(key, (chainCosts.get(key) ?? 0) + (costs[i] as number));
+	}
+	const chainCost = (i: number) => chainCosts.get(checkouts[i] as string) as number;
+	return rows
+		.map((_, i) => i)
+		.sort((a, b) => chainCost(b) - chainCost(a) || (costs[b] as number) - (costs[a] as number));
+}
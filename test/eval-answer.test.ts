@@ -0,0 +1,156 @@
+import { describe, expect, test } from "bun:test";
+import { checkLinks, toAskOutcome } from "../scripts/eval/answer";
+import type { Step, TurnResult } from "../src/types";
+
+const REPO = "https://github.com/acme/widgets";
+const SHA = "0123456789abcdef0123456789abcdef01234567";
+const SHORT_SHA = SHA.slice(0, 12);
+
+function makeTurn(overrides: Partial<TurnResult> = {}): TurnResult {
+	return {
+		id: "t1",
+		prompt: "How does it work?",
+		steps: [],
+		usage: { inputTokens: 100, outputTokens: 20, totalTokens: 120, cacheReadTokens: 50, cacheWriteTokens: 5 },
+		metadata: {
+			iterations: 1,
+			latencyMs: 1234,
+			model: { provider: "openrouter", id: "anthropic/claude-sonnet-4.6" },
+			thinkingEffort: "medium",
+			repo: { url: REPO, commitish: SHA },
+			config: { maxIterations: 20 },
+		},
+		error: null,
+		startedAt: 1000,
+		endedAt: 2234,
+		...overrides,
+	};
+}
+
+function text(value: string): Step {
+	return { type: "text", text: value, role: "assistant" };
+}
+
+function toolCall(name: string, params: Record<string, unknown>): Step {
+	return { type: "tool_call", id: `call-${name}`, name, params, output: "", isError: false, durationMs: 1 };
+}
+
+describe("toAskOutcome", () => {
+	test("answer is the text after the last tool call", () => {
+		const turn = makeTurn({
+			steps: [
+				text("Let me look around."),
+				toolCall("rg", { pattern: "main" }),
+				text("Found it, reading the file."),
+				toolCall("read", { path: "src/main.ts" }),
+				text("It starts in main."),
+				text("Then it exits."),
+			],
+		});
+		expect(toAskOutcome(turn, REPO, SHA).response).toBe("It starts in main.\n\nThen it exits.");
+	});
+
+	test("answer is all text when no tools were called", () => {
+		const turn = makeTurn({ steps: [{ type: "thinking", text: "hmm" }, text("First."), text("Second.")] });
+		expect(toAskOutcome(turn, REPO, SHA).response).toBe("First.\n\nSecond.");
+	});
+
+	test("answer is empty when the turn ends on a tool call", () => {
+		const turn = makeTurn({ steps: [text("Looking."), toolCall("ls", {})] });
+		expect(toAskOutcome(turn, REPO, SHA).response).toBe("");
+	});
+
+	test("maps tool calls, latency, usage and thinking effort", () => {
+		const turn = makeTurn({
+			steps: [toolCall("read", { path: "a.ts" }), toolCall("ls", { path: "." }), text("Done.")],
+		});
+		const outcome = toAskOutcome(turn, REPO, SHA);
+		expect(outcome.toolCalls).toEqual([
+			{ name: "read", arguments: { path: "a.ts" } },
+			{ name: "ls", arguments: { path: "." } },
+		]);
+		expect(outcome.inferenceTimeMs).toBe(1234);
+		expect(outcome.usage).toEqual({
+			inputTokens: 100,
+			outputTokens: 20,
+			totalTokens: 120,
+			cacheReadTokens: 50,
+			cacheWriteTokens: 5,
+		});
+		expect(outcome.responseEffort).toBe("medium");
+	});
+
+	test("throws on an error turn with no answer text", () => {
+		const turn = makeTurn({
+			steps: [toolCall("rg", { pattern: "x" })],
+			error: { errorType: "max_iterations", message: "Reached 20 iterations", retryability: "no" },
+		});
+		expect(() => toAskOutcome(turn, REPO, SHA)).toThrow("max_iterations: Reached 20 iterations");
+	});
+
+	test("keeps the partial answer of an error turn that produced text", () => {
+		const turn = makeTurn({
+			steps: [text("Partial answer.")],
+			error: { errorType: "network_error", message: "socket hang up", retryability: "yes" },
+		});
+		expect(toAskOutcome(turn, REPO, SHA).response).toBe("Partial answer.");
+	});
+
+	test("counts links in the answer", () => {
+		const turn = makeTurn({
+			steps: [text(`See [main](${REPO}/blob/${SHORT_SHA}/src/main.ts#L3) and [docs](https://example.com/docs).`)],
+		});
+		const outcome = toAskOutcome(turn, REPO, SHA);
+		expect(outcome.totalLinks).toBe(2);
+		expect(outcome.invalidLinks).toEqual(["https://example.com/docs"]);
+	});
+});
+
+describe("checkLinks", () => {
+	const answer = (...urls: string[]) => urls.map((url, i) => `[link ${i}](${url})`).join("\n");
+
+	test("accepts blob and tree permalinks at the pinned commit", () => {
+		const result = checkLinks(
+			answer(`${REPO}/blob/${SHORT_SHA}/src/a.ts#L1`, `${REPO}/tree/${SHORT_SHA}/src`),
+			REPO,
+			SHA,
+		);
+		expect(result).toEqual({ total: 2, invalid: [] });
+	});
+
+	test("accepts links to the full SHA when the prompt used the 12-char one", () => {
+		expect(checkLinks(answer(`${REPO}/blob/${SHA}/src/a.ts`), REPO, SHA).invalid).toEqual([]);
+	});
+
+	test("accepts full-SHA links when the dataset pins a 12-char SHA", () => {
+		expect(checkLinks(answer(`${REPO}/blob/${SHA}/src/a.ts`), REPO, SHORT_SHA).invalid).toEqual([]);
+	});
+
+	test("ignores a .git suffix or trailing slash on the repository URL", () => {
+		const links = answer(`${REPO}/blob/${SHORT_SHA}/src/a.ts`);
+		expect(checkLinks(links, `${REPO}.git`, SHA).invalid).toEqual([]);
+		expect(checkLinks(links, `${REPO}/`, SHA).invalid).toEqual([]);
+	});
+
+	test("rejects links that keep the .git suffix", () => {
+		const url = `${REPO}.git/blob/${SHORT_SHA}/src/a.ts`;
+		expect(checkLinks(answer(url), `${REPO}.git`, SHA).invalid).toEqual([url]);
+	});
+
+	test("rejects branch links, other commits, other repositories and foreign hosts", () => {
+		const urls = [
+			`${REPO}/blob/main/src/a.ts`,
+			`${REPO}/blob/fedcba9876543210/src/a.ts`,
+			`https://github.com/acme/widgets-fork/blob/${SHORT_SHA}/src/a.ts`,
+			`https://gitlab.com/acme/widgets/-/blob/${SHORT_SHA}/src/a.ts`,
+			`${REPO}/commit/${SHA}`,
+			"https://example.com/docs",
+		];
+		expect(checkLinks(answer(...urls), REPO, SHA)).toEqual({ total: urls.length, invalid: urls });
+	});
+
+	test("only counts markdown link targets", () => {
+		const response = `Bare ${REPO}/blob/main/a.ts is not a link, [this](${REPO}/blob/${SHORT_SHA}/a.ts) is.`;
+		expect(checkLinks(response, REPO, SHA)).toEqual({ total: 1, invalid: [] });
+	});
+});
@@ -0,0 +1,78 @@
+import { afterEach, beforeEach, describe, expect, test } from "bun:test";
+import { mkdir, mkdtemp, readdir, readFile, rm, writeFile } from "node:fs/promises";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
+import { cacheKey, DiskCache, writeFileAtomic } from "../scripts/eval/cache";
+
+let dir: string;
+
+beforeEach(async () => {
+	dir = await mkdtemp(join(tmpdir(), "eval-cache-test-"));
+});
+
+afterEach(async () => {
+	await rm(dir, { recursive: true, force: true });
+});
+
+describe("cacheKey", () => {
+	test("is a stable sha256 hex digest", () => {
+		const key = cacheKey("model", "prompt");
+		expect(key).toMatch(/^[0-9a-f]{64}$/);
+		expect(cacheKey("model", "prompt")).toBe(key);
+	});
+
+	test("ignores CRLF vs LF and surrounding whitespace", () => {
+		expect(cacheKey("line one\r\nline two", "q")).toBe(cacheKey("  line one\nline two\n", "q"));
+	});
+
+	test("keeps part boundaries distinct", () => {
+		expect(cacheKey("ab", "c")).not.toBe(cacheKey("a", "bc"));
+	});
+});
+
+describe("DiskCache", () => {
+	test("round-trips a value", async () => {
+		const cache = new DiskCache<{ answer: string }>(dir);
+		const key = cacheKey("k");
+		await cache.set(key, { answer: "42" });
+		expect(await cache.get(key)).toEqual({ answer: "42" });
+	});
+
+	test("shards entries by key prefix", async () => {
+		const cache = new DiskCache<number>(dir);
+		const key = cacheKey("sharded");
+		await cache.set(key, 1);
+		expect(await readdir(join(dir, key.slice(0, 2)))).toEqual([`${key}.json`]);
+	});
+
+	test("treats a missing entry as a miss", async () => {
+		const cache = new DiskCache<number>(dir);
+		expect(await cache.get(cacheKey("absent"))).toBeUndefined();
+	});
+
+	test("treats an unreadable entry as a miss", async () => {
+		const cache = new DiskCache<number>(dir);
+		const key = cacheKey("corrupt");
+		await mkdir(join(dir, key.slice(0, 2)), { recursive: true });
+		await writeFile(join(dir, key.slice(0, 2), `${key}.json`), '{"createdAt": "2026-', "utf-8");
+		expect(await cache.get(key)).toBeUndefined();
+	});
+});
+
+describe("writeFileAtomic", () => {
+	test("writes and replaces the target without leaving temp files", async () => {
+		const path = join(dir, "out.csv");
+		await writeFileAtomic(path, "first");
+		await writeFileAtomic(path, "second");
+		expect(await readFile(path, "utf-8")).toBe("second");
+		expect(await readdir(dir)).toEqual(["out.csv"]);
+	});
+
+	test("removes the temp file and rethrows when the rename fails", async () => {
+		// Renaming a file over a directory fails, after the temp file has been written
+		const path = join(dir, "target");
+		await mkdir(path);
+		await expect(writeFileAtomic(path, "data")).rejects.toThrow();
+		expect(await readdir(dir)).toEqual(["target"]);
+	});
+});
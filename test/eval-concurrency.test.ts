@@ -0,0 +1,187 @@
+import { describe, expect, test } from "bun:test";
+import { mapInSerialGroups, mapWithConcurrency, Semaphore, singleFlight } from "../scripts/eval/concurrency";
+
+function deferred<T = void>() {
+	let resolve!: (value: T) => void;
+	const promise = new Promise<T>((r) => {
+		resolve = r;
+	});
+	return { promise, resolve };
+}
+
+describe("Semaphore", () => {
+	test("never runs more than its permits at once", async () => {
+		const semaphore = new Semaphore(2);
+		let running = 0;
+		let peak = 0;
+		await Promise.all(
+			Array.from({ length: 6 }, () =>
+				semaphore.run(async () => {
+					running++;
+					peak = Math.max(peak, running);
+					await Bun.sleep(5);
+					running--;
+				}),
+			),
+		);
+		expect(peak).toBe(2);
+	});
+
+	test("hands permits to waiters in arrival order", async () => {
+		const semaphore = new Semaphore(1);
+		const gate = deferred();
+		const started: number[] = [];
+		const first = semaphore.run(async () => {
+			started.push(0);
+			await gate.promise;
+		});
+		const rest = [1, 2, 3].map((i) =>
+			semaphore.run(async () => {
+				started.push(i);
+			}),
+		);
+		gate.resolve();
+		await Promise.all([first, ...rest]);
+		expect(started).toEqual([0, 1, 2, 3]);
+	});
+
+	test("releases the permit when the task throws", async () => {
+		const semaphore = new Semaphore(1);
+		await expect(semaphore.run(() => Promise.reject(new Error("boom")))).rejects.toThrow("boom");
+		expect(await semaphore.run(async () => "next")).toBe("next");
+	});
+});
+
+describe("singleFlight", () => {
+	test("shares one call between callers with the same key", async () => {
+		const inflight = new Map<string, Promise<number>>();
+		let calls = 0;
+		const fn = async () => ++calls;
+		const [a, b] = await Promise.all([singleFlight(inflight, "k", fn), singleFlight(inflight, "k", fn)]);
+		expect(a).toBe(1);
+		expect(b).toBe(1);
+		expect(calls).toBe(1);
+	});
+
+	test("runs separately for different keys", async () => {
+		const inflight = new Map<string, Promise<number>>();
+		let calls = 0;
+		const fn = async () => ++calls;
+		await Promise.all([singleFlight(inflight, "a", fn), singleFlight(inflight, "b", fn)]);
+		expect(calls).toBe(2);
+	});
+});
+
+describe("mapWithConcurrency", () => {
+	test("returns results in input order under a custom start order", async () => {
+		const items = [10, 20, 30, 40];
+		const startOrder: number[] = [];
+		const results = await mapWithConcurrency(
+			items,
+			2,
+			async (item, index) => {
+				startOrder.push(index);
+				// Later-started items finish first, so completion order differs from input order
+				await Bun.sleep(40 - item);
+				return item * 2;
+			},
+			[3, 1, 2, 0],
+		);
+		expect(startOrder).toEqual([3, 1, 2, 0]);
+		expect(results).toEqual([20, 40, 60, 80]);
+	});
+
+	test("keeps at most `limit` calls in flight", async () => {
+		let running = 0;
+		let peak = 0;
+		await mapWithConcurrency(Array.from({ length: 10 }), 3, async () => {
+			running++;
+			peak = Math.max(peak, running);
+			await Bun.sleep(2);
+			running--;
+		});
+		expect(peak).toBe(3);
+	});
+
+	test("handles an empty input", async () => {
+		expect(await mapWithConcurrency([], 4, async () => 1)).toEqual([]);
+	});
+});
+
+describe("mapInSerialGroups", () => {
+	test("never overlaps items of the same group", async () => {
+		const items = ["a", "b", "a", "c", "a", "b"];
+		const running = new Set<string>();
+		let overlapped = false;
+		await mapInSerialGroups(
+			items,
+			4,
+			(item) => item,
+			async (item) => {
+				if (running.has(item)) overlapped = true;
+				running.add(item);
+				await Bun.sleep(2);
+				running.delete(item);
+			},
+		);
+		expect(overlapped).toBe(false);
+	});
+
+	test("keeps other groups moving while one group's chain is busy", async () => {
+		// Three "a" items would pin both workers of a per-item pool behind the
+		// group lock; as one chain, "a" holds a single slot and b/c share the other
+		const items = ["a", "a", "a", "b", "c"];
+		const finished: string[] = [];
+		let running = 0;
+		let peak = 0;
+		await mapInSerialGroups(
+			items,
+			2,
+			(item) => item,
+			async (item) => {
+				running++;
+				peak = Math.max(peak, running);
+				await Bun.sleep(item === "a" ? 20 : 2);
+				running--;
+				finished.push(item);
+			},
+		);
+		expect(peak).toBe(2);
+		expect(finished.slice(0, 2)).toEqual(["b", "c"]);
+	});
+
+	test("starts chains and orders items within a chain by `order`", async () => {
+		const items = ["x", "y", "x", "y"];
+		const started: number[] = [];
+		const results = await mapInSerialGroups(
+			items,
+			1,
+			(item) => item,
+			async (item, index) => {
+				started.push(index);
+				return `${item}${index}`;
+			},
+			[3, 2, 1, 0],
+		);
+		expect(started).toEqual([3, 1, 2, 0]);
+		expect(results).toEqual(["x0", "y1", "x2", "y3"]);
+	});
+
+	test("passes the item index to `groupOf`", async () => {
+		const keys = ["k1", "k2", "k1"];
+		const seen: number[][] = [[], []];
+		await mapInSerialGroups(
+			[10, 20, 30],
+			2,
+			(_, index) => keys[index] as string,
+			async (_, index) => {
+				seen[keys[index] === "k1" ? 0 : 1]?.push(index);
+			},
+		);
+		expect(seen).toEqual([[0, 2], [1]]);
+	});
+
+	test("handles an empty input", async () => {
+		expect(await mapInSerialGroups([], 4, () => "k", async () => 1)).toEqual([]);
+	});
+});
@@ -0,0 +1,70 @@
+import { describe, expect, test } from "bun:test";
+import { parseCsv } from "../scripts/eval/csv";
+
+const HEADER = "session_id,repository,commit_id,question";
+
+function csv(...lines: string[]): string {
+	return `${[HEADER, ...lines].join("\n")}\n`;
+}
+
+function questions(content: string, limit?: number): string[] {
+	const parsed = parseCsv(content, limit);
+	if (!parsed.ok) throw new Error(parsed.error);
+	return parsed.rows.map((row) => row.question);
+}
+
+const THREE_ROWS = csv(
+	"1,https://github.com/a/b,abc,first",
+	"2,https://github.com/a/b,abc,second",
+	"3,https://github.com/a/b,abc,third",
+);
+
+describe("parseCsv limit", () => {
+	test("reads every row without a limit", () => {
+		expect(questions(THREE_ROWS)).toEqual(["first", "second", "third"]);
+	});
+
+	test("stops after `limit` rows when it is smaller than the row count", () => {
+		expect(questions(THREE_ROWS, 1)).toEqual(["first"]);
+		expect(questions(THREE_ROWS, 2)).toEqual(["first", "second"]);
+	});
+
+	test("reads every row when the limit equals the row count", () => {
+		expect(questions(THREE_ROWS, 3)).toEqual(["first", "second", "third"]);
+	});
+
+	test("reads every row when the limit exceeds the row count", () => {
+		expect(questions(THREE_ROWS, 10)).toEqual(["first", "second", "third"]);
+	});
+
+	test("keeps a quoted multi-line field intact at the cut-off", () => {
+		const content = csv(
+			"1,https://github.com/a/b,abc,first",
+			'2,https://github.com/a/b,abc,"line one',
+			"line two, with a comma",
+			'line three"',
+			"3,https://github.com/a/b,abc,third",
+		);
+		expect(questions(content, 2)).toEqual(["first", "line one\nline two, with a comma\nline three"]);
+		expect(questions(content, 1)).toEqual(["first"]);
+	});
+
+	test("does not count blank lines toward the limit", () => {
+		const content = csv(
+			"",
+			"1,https://github.com/a/b,abc,first",
+			"",
+			"",
+			"2,https://github.com/a/b,abc,second",
+			"3,https://github.com/a/b,abc,third",
+		);
+		expect(questions(content, 2)).toEqual(["first", "second"]);
+	});
+
+	test("does not count blank CRLF lines toward the limit", () => {
+		const first = "1,https://github.com/a/b,abc,first";
+		const second = "2,https://github.com/a/b,abc,second";
+		const content = [HEADER, "", first, "", second, ""].join("\r\n");
+		expect(questions(content, 2)).toEqual(["first", "second"]);
+	});
+});
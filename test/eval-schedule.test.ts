@@ -0,0 +1,108 @@
+import { describe, expect, test } from "bun:test";
+import type { EvalRow } from "../scripts/eval/csv";
+import { checkoutKeys, longestFirstOrder } from "../scripts/eval/schedule";
+
+const SHA = "0123456789abcdef0123456789abcdef01234567";
+
+function makeRow(repository: string, commit_id: string, question = "q"): EvalRow {
+	return {
+		session_id: "",
+		repository,
+		commit_id,
+		question,
+		is_answer_complete: "",
+		is_evidence_supported: "",
+		is_evidence_linked: "",
+		is_reasoning_sound: "",
+		misc_feedback: "",
+		answer: "",
+		broken_link_ratio: "",
+		tool_calls: "",
+		files_read: "",
+		inference_time_ms: "",
+		input_tokens: "",
+		output_tokens: "",
+		total_tokens: "",
+		cache_read_tokens: "",
+		cache_write_tokens: "",
+		ask_model: "",
+		judge_model: "",
+		ask_system_prompt: "",
+		judge_prompt: "",
+		reasoning_level: "",
+	};
+}
+
+describe("checkoutKeys", () => {
+	test("keys on the repository path and 12-char SHA", () => {
+		expect(checkoutKeys([makeRow("https://github.com/acme/widgets", SHA)])).toEqual([
+			`acme/widgets@${SHA.slice(0, 12)}`,
+		]);
+	});
+
+	test("shares a key across .git suffixes, trailing slashes and hosts", () => {
+		const keys = checkoutKeys([
+			makeRow("https://github.com/acme/widgets", SHA),
+			makeRow("https://github.com/acme/widgets.git", SHA),
+			makeRow("https://gitlab.com/acme/widgets", SHA),
+		]);
+		expect(new Set(keys).size).toBe(1);
+	});
+
+	test("shares a key between full, 12-char and abbreviated SHAs of one commit", () => {
+		const keys = checkoutKeys([
+			makeRow("https://github.com/acme/widgets", SHA),
+			makeRow("https://github.com/acme/widgets", SHA.slice(0, 12)),
+			makeRow("https://github.com/acme/widgets", SHA.slice(0, 7)),
+			makeRow("https://github.com/acme/widgets", SHA.toUpperCase()),
+		]);
+		expect(new Set(keys).size).toBe(1);
+	});
+
+	test("resolves an abbreviated SHA through a longer one anywhere in the dataset", () => {
+		const keys = checkoutKeys([
+			makeRow("https://github.com/acme/widgets", SHA.slice(0, 7)),
+			makeRow("https://github.com/acme/widgets", SHA),
+		]);
+		expect(keys).toEqual([`acme/widgets@${SHA.slice(0, 12)}`, `acme/widgets@${SHA.slice(0, 12)}`]);
+	});
+
+	test("separates different commits and different repositories", () => {
+		const keys = checkoutKeys([
+			makeRow("https://github.com/acme/widgets", SHA),
+			makeRow("https://github.com/acme/widgets", "fedcba9876543210"),
+			makeRow("https://github.com/acme/gadgets", SHA),
+		]);
+		expect(new Set(keys).size).toBe(3);
+	});
+
+	test("keys branch names as written without prefix matching", () => {
+		const keys = checkoutKeys([
+			makeRow("https://github.com/acme/widgets", "main"),
+			makeRow("https://github.com/acme/widgets", "maintenance"),
+		]);
+		expect(keys).toEqual(["acme/widgets@main", "acme/widgets@maintenance"]);
+	});
+
+	test("falls back to the raw URL when it can't be parsed", () => {
+		expect(checkoutKeys([makeRow("not a url", SHA)])).toEqual([`not a url@${SHA.slice(0, 12)}`]);
+	});
+});
+
+describe("longestFirstOrder", () => {
+	test("orders chains by total cost, then rows within a chain longest-first", () => {
+		const rows = [
+			makeRow("r", "a", "x".repeat(50)),
+			makeRow("r", "b", "x".repeat(10)),
+			makeRow("r", "b", "x".repeat(30)),
+			makeRow("r", "b", "x".repeat(20)),
+		];
+		// Chain b (60) outweighs chain a (50) even though a holds the single longest row
+		expect(longestFirstOrder(rows, ["a", "b", "b", "b"])).toEqual([2, 3, 1, 0]);
+	});
+
+	test("is plain longest-first when every row has its own chain", () => {
+		const rows = [makeRow("r", "a", "xx"), makeRow("r", "b", "xxxx"), makeRow("r", "c", "xxx")];
+		expect(longestFirstOrder(rows, ["a", "b", "c"])).toEqual([1, 2, 0]);
+	});
+});